@@ -0,0 +1,37 @@
+"""Dataclasses that are frozen for type checkers only."""
+
+from dataclasses import field
+from typing import TypeVar
+
+from typing_extensions import dataclass_transform
+
+_T = TypeVar("_T")
+
+
+@dataclass_transform(frozen_default=True, field_specifiers=(field,))
+def fast_frozen_dataclass(cls: type[_T]) -> type[_T]:
+    """
+    Mark a slotted dataclass as frozen for type checkers only.
+
+    ``@dataclass(frozen=True)`` guards every assignment at runtime, which makes
+    its ``__init__`` go through ``object.__setattr__`` for each field, several
+    times slower than plain assignment. Stack this decorator on a plain
+    ``@dataclass(slots=True)`` instead: type checkers still reject assignments
+    to its fields, but nothing does at runtime, where the class is returned
+    unchanged (and stays unhashable, like any dataclass with ``eq=True``).
+
+    This lives outside `event_framework.core` because it is applied at
+    import time, and ``dataclass_transform`` cannot tag a function compiled
+    by mypyc.
+
+    Parameters
+    ----------
+    cls : type
+        Slotted dataclass to decorate.
+
+    Returns
+    -------
+    type
+        The same class.
+    """
+    return cls
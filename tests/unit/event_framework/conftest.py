@@ -0,0 +1,17 @@
+"""Shared fixtures for the event_framework unit tests."""
+
+import pytest
+
+from event_framework.core import ActualOccasion, Nexus
+
+
+@pytest.fixture
+def nexus() -> Nexus:
+    """Return a fresh nexus with no occasions or middlewares."""
+    return Nexus(name="test")
+
+
+@pytest.fixture
+def occasion() -> ActualOccasion:
+    """Return a fresh occasion with empty state and no bindings."""
+    return ActualOccasion(name="test", state={})
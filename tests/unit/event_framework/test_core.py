@@ -1,20 +1,50 @@
 """Unit tests for event_framework.core module."""
 
-# pylint: disable=protected-access, unused-argument
-
+# pylint: disable=protected-access, unused-argument, too-many-public-methods, too-many-lines
+
+import json
+import pickle
+import subprocess
+import sys
+import threading
+from collections import deque
+from copy import deepcopy
+from dataclasses import asdict, dataclass, fields, replace
 from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Callable
 from uuid import UUID
 
 import pytest
 
+from event_framework import core
 from event_framework.core import (
     Datum,
     ActualOccasion,
     Prehension,
     Nexus,
+    SubjectiveForm,
+    name_selector,
+)
+
+# mypyc-compiled classes cannot be subclassed from Python (see README)
+requires_pure_python = pytest.mark.skipif(
+    not core.__file__.endswith(".py"),
+    reason="compiled core classes cannot be subclassed",
 )
 
 
+def make_payload_middleware(key: str, value: Any) -> Callable[[Datum], Datum]:
+    """Return a middleware that sets one payload key."""
+
+    def middleware(datum: Datum) -> Datum:
+        payload = datum.payload.copy()
+        payload[key] = value
+        return datum.replace(payload=payload)
+
+    return middleware
+
+
 class TestDatum:
     """Tests for the Datum class."""
 
@@ -25,12 +55,50 @@ class TestDatum:
         assert datum.name == "test_event"
         assert datum.payload == {"key": "value"}
         assert isinstance(datum.id, str)
-        assert isinstance(UUID(datum.id), UUID)
+        assert len(datum.id) == 36 and datum.id.count("-") == 4
         assert isinstance(datum.created_at, datetime)
         assert datum.created_at.tzinfo == timezone.utc
         assert datum.correlation_id is None
         assert datum.causation_id is None
 
+    def test_datum_ids_are_unique_across_batches(self):
+        """Test default ids stay unique and valid once the id pool refills."""
+        ids = [Datum(name="test", payload={}).id for _ in range(1000)]
+
+        assert len(set(ids)) == len(ids)
+        assert all(UUID(i).version == 4 for i in ids)
+        assert all(str(UUID(i)) == i for i in ids)
+
+    def test_id_refill_keeps_one_id_for_the_caller(self, monkeypatch):
+        """Test a pool refill returns its own id rather than popping the shared pool."""
+        monkeypatch.setattr(core, "_id_pool", deque())
+
+        first = core._new_id()
+
+        assert len(core._id_pool) == core._ID_BATCH_SIZE - 1
+        assert first not in core._id_pool
+
+    def test_core_imports_without_register_at_fork(self):
+        """Test the module imports on platforms without os.register_at_fork."""
+        code = "import os; del os.register_at_fork; import event_framework.core"
+
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_datum_with_parent(self):
+        """Test with_parent stamps correlation and causation ids from the parent."""
+        root = Datum(name="root", payload={})
+        child = Datum(name="child", payload={"x": 1}).with_parent(root)
+        grandchild = Datum(name="grandchild", payload={})
+        stamped = grandchild.with_parent(child)
+
+        assert child.correlation_id == root.id
+        assert child.causation_id == root.id
+        assert stamped.correlation_id == root.id
+        assert stamped.causation_id == child.id
+        assert stamped.id == grandchild.id
+        assert stamped.created_at == grandchild.created_at
+        assert grandchild.correlation_id is None
+
     def test_datum_creation_with_all_fields(self):
         """Test creating a Datum with all fields specified."""
         created_time = datetime.now(timezone.utc)
@@ -50,6 +118,7 @@ class TestDatum:
         assert datum.correlation_id == "corr-123"
         assert datum.causation_id == "cause-456"
 
+    @pytest.mark.xfail(strict=True, reason="Datum is frozen for type checkers only")
     def test_datum_immutability(self):
         """Test that Datum is immutable (frozen dataclass)."""
         datum = Datum(name="test", payload={})
@@ -60,6 +129,160 @@ class TestDatum:
         with pytest.raises(AttributeError):
             datum.payload = {"new": "payload"}  # type: ignore
 
+    def test_datum_replace(self):
+        """Test replacing some fields of a Datum keeps the others."""
+        datum = Datum(name="test", payload={"key": "value"}, correlation_id="corr")
+
+        result = datum.replace(payload={**datum.payload, "extra": 1})
+
+        assert result.payload == {"key": "value", "extra": 1}
+        assert datum.payload == {"key": "value"}
+        assert result.id == datum.id
+        assert result.created_at == datum.created_at
+        assert result.correlation_id == "corr"
+
+    def test_datum_derive(self):
+        """Test deriving a Datum replaces fields and mints a fresh id."""
+        datum = Datum(name="test", payload={"key": "value"})
+
+        result = datum.derive(name="derived")
+        pinned = datum.derive(id="custom-id")
+
+        assert result.name == "derived"
+        assert result.payload == {"key": "value"}
+        assert result.id != datum.id
+        assert result.created_at >= datum.created_at
+        assert pinned.id == "custom-id"
+
+    def test_datum_pickle_round_trip(self):
+        """Test that a Datum survives pickling."""
+        datum = Datum(name="test", payload={"key": [1, 2]}, correlation_id="corr")
+
+        assert pickle.loads(pickle.dumps(datum)) == datum
+
+    def test_datum_deepcopy(self):
+        """Test that a deep copy of a Datum is equal but owns its payload."""
+        datum = Datum(name="test", payload={"key": [1, 2]})
+
+        copied = deepcopy(datum)
+
+        assert copied == datum
+        assert copied.payload["key"] is not datum.payload["key"]
+
+    def test_datum_asdict_and_json(self):
+        """Test that a Datum converts to a dict and its payload to JSON."""
+        datum = Datum(name="test", payload={"key": "value"})
+
+        as_dict = asdict(datum)
+
+        assert as_dict["name"] == "test"
+        assert as_dict["payload"] == {"key": "value"}
+        assert as_dict["id"] == datum.id
+        assert json.loads(json.dumps(datum.payload)) == {"key": "value"}
+
+    def test_datum_payload_is_shared_by_copies(self):
+        """Test that shallow copies of a Datum share its payload."""
+        datum = Datum(name="test", payload={"key": "value"})
+
+        copy = replace(datum, correlation_id="corr")
+
+        assert copy.payload is datum.payload
+
+    def test_datum_name_is_interned(self):
+        """Test that names built at runtime share the interned string."""
+        suffix = "event"
+        datum = Datum(name="test_" + suffix, payload={})
+
+        assert datum.name is sys.intern("test_event")
+
+    def test_datum_name_can_be_a_str_enum(self):
+        """Test that str subclasses such as enum members are accepted as names."""
+
+        class Event(str, Enum):
+            """Event names."""
+
+            PLACED = "placed"
+
+        datum = Datum(name=Event.PLACED, payload={})
+
+        assert datum.name is Event.PLACED
+        assert name_selector("placed")(datum)
+
+    def test_rethreaded_copies_every_field(self):
+        """Test rethreading a datum only changes its correlation/causation ids."""
+        datum = Datum(name="test", payload={"key": "value"}, correlation_id="old")
+
+        result = Datum._rethreaded(datum, "corr", "cause")  # type: ignore[attr-defined]
+
+        assert result == replace(datum, correlation_id="corr", causation_id="cause")
+        assert result.payload is datum.payload
+
+    @requires_pure_python
+    def test_rethreaded_keeps_subclass_fields(self):
+        """Test rethreading a Datum subclass preserves its extra fields."""
+
+        @dataclass(slots=True)
+        class TaggedDatum(Datum):
+            """Datum with an extra field."""
+
+            tag: str = "untagged"
+
+        datum = TaggedDatum(name="test", payload={}, tag="tagged")
+
+        result = Datum._rethreaded(datum, "corr", "cause")  # type: ignore[attr-defined]
+
+        assert isinstance(result, TaggedDatum)
+        assert result.tag == "tagged"
+        assert result.causation_id == "cause"
+
+    @requires_pure_python
+    def test_with_parent_keeps_subclass_fields(self):
+        """Test with_parent on a Datum subclass preserves its extra fields."""
+
+        @dataclass(slots=True)
+        class TaggedDatum(Datum):
+            """Datum with an extra field."""
+
+            tag: str = "untagged"
+
+        parent = Datum(name="parent", payload={})
+
+        result = TaggedDatum(name="test", payload={}, tag="tagged").with_parent(parent)
+
+        assert isinstance(result, TaggedDatum)
+        assert result.tag == "tagged"
+        assert result.causation_id == parent.id
+
+    def test_datum_is_unhashable(self):
+        """Test that Datum carries no hash cache and, like its payload, is unhashable."""
+        datum = Datum(name="test", payload={})
+
+        assert "_hash" not in {f.name for f in fields(Datum)}
+        with pytest.raises(TypeError):
+            hash(datum)
+
+    def test_datum_has_no_instance_dict(self):
+        """Test that Datum stores its fields in slots."""
+        datum = Datum(name="test", payload={})
+
+        assert not hasattr(datum, "__dict__")
+
+
+class TestNameSelector:
+    """Tests for the name_selector helper."""
+
+    def test_name_selector_matches_by_name(self):
+        """Test the selector matches data with the given name only."""
+        selector = name_selector("input")
+
+        assert selector(Datum(name="input", payload={}))
+        assert not selector(Datum(name="other", payload={}))
+
+    def test_name_selector_is_shared_per_name(self):
+        """Test the same selector object is returned for the same name."""
+        assert name_selector("input") is name_selector("input")
+        assert name_selector("input") is not name_selector("other")
+
 
 class TestActualOccasion:
     """Tests for the ActualOccasion class."""
@@ -70,11 +293,16 @@ class TestActualOccasion:
 
         assert occasion.name == "test_occasion"
         assert occasion.state == {"count": 0}
-        assert not occasion._bindings  # type: ignore[arg-type]
+        assert not occasion._selectors  # type: ignore[arg-type]
+        assert not occasion._forms  # type: ignore[arg-type]
 
-    def test_on_method_returns_self(self):
+    def test_occasion_has_no_instance_dict(self, occasion):
+        """Test that ActualOccasion stores its fields in slots."""
+
+        assert not hasattr(occasion, "__dict__")
+
+    def test_on_method_returns_self(self, occasion):
         """Test that the on method returns self for chaining."""
-        occasion = ActualOccasion(name="test", state={})
 
         def selector(d: Datum):
             return True
@@ -85,15 +313,14 @@ class TestActualOccasion:
         result = occasion.on(selector, form)
 
         assert result is occasion
-        assert len(occasion._bindings) == 1  # type: ignore[arg-type]
-        assert occasion._bindings[0] == (selector, form)  # type: ignore[arg-type]
+        assert len(occasion._selectors) == 1  # type: ignore[arg-type]
+        assert occasion._selectors[0] is selector  # type: ignore[arg-type]
+        assert occasion._forms[0] is form  # type: ignore[arg-type]
 
-    def test_handle_no_matching_selectors(self):
+    def test_handle_no_matching_selectors(self, occasion):
         """Test handle when no selectors match the datum."""
-        occasion = ActualOccasion(name="test", state={})
 
-        def selector(d: Datum):
-            return d.name == "other_event"
+        selector = name_selector("other_event")
 
         def form(occ: ActualOccasion, d: Datum):
             return [Datum(name="output", payload={})]
@@ -101,7 +328,7 @@ class TestActualOccasion:
         occasion.on(selector, form)
         datum = Datum(name="test_event", payload={})
 
-        result = list(occasion.handle(datum))
+        result = occasion.handle(datum)
 
         assert not result
 
@@ -115,22 +342,40 @@ class TestActualOccasion:
                 Datum(name="incremented", payload={"new_count": occ.state["counter"]})
             ]
 
-        def selector(d: Datum) -> bool:
-            return d.name == "increment"
+        selector = name_selector("increment")
 
         occasion.on(selector, increment_form)
 
         datum = Datum(name="increment", payload={})
-        result = list(occasion.handle(datum))
+        result = occasion.handle(datum)
 
         assert len(result) == 1
         assert result[0].name == "incremented"
         assert result[0].payload == {"new_count": 1}
         assert occasion.state["counter"] == 1
 
-    def test_handle_multiple_matching_selectors(self):
+    def test_handle_name_bindings(self, occasion):
+        """Test handle runs name-keyed forms before selector-based ones."""
+
+        def keyed_form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            return [Datum(name="keyed", payload={})]
+
+        def generic_form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            return [Datum(name="generic", payload={})]
+
+        result = occasion.on(lambda d: True, generic_form).on_name("input", keyed_form)
+
+        assert result is occasion
+        assert [d.name for d in occasion.handle(Datum(name="input", payload={}))] == [
+            "keyed",
+            "generic",
+        ]
+        assert [d.name for d in occasion.handle(Datum(name="other", payload={}))] == [
+            "generic"
+        ]
+
+    def test_handle_multiple_matching_selectors(self, occasion):
         """Test handle with multiple matching selectors."""
-        occasion = ActualOccasion(name="test", state={})
 
         def form1(occ: ActualOccasion, d: Datum) -> list[Datum]:
             return [Datum(name="output1", payload={"from": "form1"})]
@@ -147,15 +392,14 @@ class TestActualOccasion:
         occasion.on(selector1, form1).on(selector2, form2)
 
         datum = Datum(name="test", payload={})
-        result = list(occasion.handle(datum))
+        result = occasion.handle(datum)
 
         assert len(result) == 2
         assert result[0].name == "output1"
         assert result[1].name == "output2"
 
-    def test_handle_form_returns_multiple_data(self):
+    def test_handle_form_returns_multiple_data(self, occasion):
         """Test handle when a form returns multiple data items."""
-        occasion = ActualOccasion(name="test", state={})
 
         def multi_form(occ: ActualOccasion, d: Datum) -> list[Datum]:
             return [
@@ -170,7 +414,7 @@ class TestActualOccasion:
         occasion.on(selector, multi_form)
 
         datum = Datum(name="test", payload={})
-        result = list(occasion.handle(datum))
+        result = occasion.handle(datum)
 
         assert len(result) == 3
         assert all(r.name.startswith("output") for r in result)
@@ -179,9 +423,8 @@ class TestActualOccasion:
 class TestPrehension:
     """Tests for the Prehension class."""
 
-    def test_prehension_creation(self):
+    def test_prehension_creation(self, occasion):
         """Test creating a Prehension."""
-        occasion = ActualOccasion(name="test", state={})
 
         def selector(d: Datum) -> bool:
             return True
@@ -195,9 +438,8 @@ class TestPrehension:
         assert prehension.selector is selector
         assert prehension.form is form
 
-    def test_prehension_immutability(self):
+    def test_prehension_immutability(self, occasion):
         """Test that Prehension is immutable."""
-        occasion = ActualOccasion(name="test", state={})
 
         def selector(d: Datum) -> bool:
             return True
@@ -210,6 +452,12 @@ class TestPrehension:
         with pytest.raises(AttributeError):
             prehension.subject = ActualOccasion(name="other", state={})  # type: ignore
 
+    def test_prehension_has_no_instance_dict(self, occasion):
+        """Test that Prehension stores its fields without an instance dict."""
+        prehension = Prehension(subject=occasion, selector=bool, form=list)
+
+        assert not hasattr(prehension, "__dict__")
+
 
 class TestNexus:
     """Tests for the Nexus class."""
@@ -219,35 +467,51 @@ class TestNexus:
         nexus = Nexus(name="test_nexus")
 
         assert nexus.name == "test_nexus"
-        assert not nexus._occasions  # type: ignore[attr-defined]
+        assert not nexus._occasions_list  # type: ignore[attr-defined]
+        assert not nexus._occasions_by_name  # type: ignore[attr-defined]
         assert not nexus._middlewares  # type: ignore[attr-defined]
 
-    def test_add_single_occasion(self):
+    def test_nexus_has_no_instance_dict(self, nexus):
+        """Test that Nexus stores its attributes in slots."""
+
+        assert not hasattr(nexus, "__dict__")
+
+    def test_add_single_occasion(self, nexus):
         """Test adding a single occasion to the nexus."""
-        nexus = Nexus(name="test")
         occasion = ActualOccasion(name="occ1", state={})
 
         result = nexus.add(occasion)
 
         assert result is nexus  # Returns self for chaining
-        assert "occ1" in nexus._occasions  # type: ignore[attr-defined]
-        assert nexus._occasions["occ1"] is occasion  # type: ignore[attr-defined]
+        assert nexus._occasions_list == [occasion]  # type: ignore[attr-defined]
+        assert "occ1" in nexus._occasions_by_name  # type: ignore[attr-defined]
+        assert nexus._occasions_by_name["occ1"] is occasion  # type: ignore[attr-defined]
 
-    def test_add_multiple_occasions(self):
+    def test_add_multiple_occasions(self, nexus):
         """Test adding multiple occasions to the nexus."""
-        nexus = Nexus(name="test")
         occ1 = ActualOccasion(name="occ1", state={})
         occ2 = ActualOccasion(name="occ2", state={})
 
         nexus.add(occ1, occ2)
 
-        assert len(nexus._occasions) == 2  # type: ignore[attr-defined]
-        assert nexus._occasions["occ1"] is occ1  # type: ignore[attr-defined]
-        assert nexus._occasions["occ2"] is occ2  # type: ignore[attr-defined]
+        assert len(nexus._occasions_list) == 2  # type: ignore[attr-defined]
+        assert nexus._occasions_by_name["occ1"] is occ1  # type: ignore[attr-defined]
+        assert nexus._occasions_by_name["occ2"] is occ2  # type: ignore[attr-defined]
 
-    def test_bind_prehensions(self):
+    def test_add_occasion_with_existing_name(self, nexus):
+        """Test re-adding a name replaces the occasion in its original position."""
+        occ1 = ActualOccasion(name="occ1", state={})
+        occ2 = ActualOccasion(name="occ2", state={})
+        replacement = ActualOccasion(name="occ1", state={"new": True})
+
+        nexus.add(occ1, occ2).add(replacement)
+
+        assert nexus._occasions_list == [replacement, occ2]  # type: ignore[attr-defined]
+        assert nexus._occasions_by_name["occ1"] is replacement  # type: ignore[attr-defined]
+        assert list(nexus.snapshot()) == ["occ1", "occ2"]
+
+    def test_bind_prehensions(self, nexus):
         """Test binding prehensions to the nexus."""
-        nexus = Nexus(name="test")
         occasion = ActualOccasion(name="occ", state={})
 
         def selector(d: Datum) -> bool:
@@ -261,66 +525,104 @@ class TestNexus:
         result = nexus.bind(prehension)
 
         assert result is nexus  # Returns self for chaining
-        assert len(occasion._bindings) == 1  # type: ignore[arg-type]
-        assert occasion._bindings[0] == (selector, form)  # type: ignore[arg-type]
+        assert len(occasion._selectors) == 1  # type: ignore[arg-type]
+        assert occasion._selectors[0] is selector  # type: ignore[arg-type]
+        assert occasion._forms[0] is form  # type: ignore[arg-type]
 
-    def test_use_middleware(self):
-        """Test adding middleware to the nexus."""
-        nexus = Nexus(name="test")
+    def test_bind_on(self, nexus):
+        """Test binding a form to a datum name."""
+        occasion = ActualOccasion(name="occ", state={})
 
-        def middleware(datum: Datum) -> Datum:
-            return Datum(
-                name=datum.name,
-                payload={**datum.payload, "middleware": "applied"},
-                id=datum.id,
-                created_at=datum.created_at,
-                correlation_id=datum.correlation_id,
-                causation_id=datum.causation_id,
-            )
+        def form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            return []
 
-        result = nexus.use(middleware)
+        result = nexus.bind_on("input", occasion, form)
 
         assert result is nexus  # Returns self for chaining
-        assert len(nexus._middlewares) == 1  # type: ignore[attr-defined]
-        assert nexus._middlewares[0] is middleware  # type: ignore[attr-defined]
-
-    def test_apply_middlewares(self):
-        """Test applying middlewares to a datum."""
-        nexus = Nexus(name="test")
-
-        def add_timestamp(datum: Datum) -> Datum:
-            return Datum(
-                name=datum.name,
-                payload={**datum.payload, "processed_at": "2001-01-01"},
-                id=datum.id,
-                created_at=datum.created_at,
-                correlation_id=datum.correlation_id,
-                causation_id=datum.causation_id,
-            )
-
-        def add_version(datum: Datum) -> Datum:
-            return Datum(
-                name=datum.name,
-                payload={**datum.payload, "version": "1.0"},
-                id=datum.id,
-                created_at=datum.created_at,
-                correlation_id=datum.correlation_id,
-                causation_id=datum.causation_id,
-            )
-
-        nexus.use(add_timestamp).use(add_version)
+        assert occasion._by_name == {"input": [form]}  # type: ignore[attr-defined]
+        assert not occasion._selectors  # type: ignore[arg-type]
+        assert not occasion._forms  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize(
+        "middlewares,expected",
+        [
+            (
+                [make_payload_middleware("timestamp", "2001-01-01")],
+                {"timestamp": "2001-01-01"},
+            ),
+            (
+                [
+                    make_payload_middleware("processed_at", "2001-01-01"),
+                    make_payload_middleware("version", "1.0"),
+                ],
+                {"processed_at": "2001-01-01", "version": "1.0"},
+            ),
+        ],
+    )
+    def test_middleware_application(self, nexus, middlewares, expected):
+        """Test middlewares are registered, composed in order and applied by emit."""
+        for middleware in middlewares:
+            assert nexus.use(middleware) is nexus  # Returns self for chaining
+
+        assert nexus._middlewares == middlewares  # type: ignore[attr-defined]
+        # A lone middleware is used as the pipeline as-is
+        assert (nexus._pipeline is middlewares[0]) == (  # type: ignore[attr-defined]
+            len(middlewares) == 1
+        )
 
         original = Datum(name="test", payload={"data": "value"})
-        result = nexus._apply_middlewares(original)  # type: ignore[attr-defined]
+        result = nexus.emit(original)
+
+        assert len(result) == 1
+        assert result[0].name == "test"
+        assert result[0].payload == {"data": "value", **expected}
+
+    def test_emit_without_middlewares(self, nexus):
+        """Test emit passes data through untouched when no middleware is installed."""
+        original = Datum(name="test", payload={})
 
-        assert result.name == "test"
-        assert result.payload["data"] == "value"
-        assert result.payload["processed_at"] == "2001-01-01"
-        assert result.payload["version"] == "1.0"
+        result = nexus.emit(original)
+
+        assert result[0] is original
+        assert nexus._pipeline is None  # type: ignore[attr-defined]
+
+    @pytest.mark.parametrize("keyed", [True, False])
+    def test_middleware_runs_before_next_form(self, nexus, keyed):
+        """Test each form's output goes through middlewares before the next form runs."""
+        calls: list[str] = []
+        occasion = ActualOccasion(name="occ", state={})
 
-    def test_emit_simple_case(self):
+        def make_form(tag: str) -> SubjectiveForm:
+            def form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+                calls.append(f"form:{tag}")
+                return [Datum(name=tag, payload={})]
+
+            return form
+
+        def middleware(d: Datum) -> Datum:
+            calls.append(f"middleware:{d.name}")
+            return d
+
+        for tag in ("a", "b"):
+            if keyed:
+                occasion.on_name("start", make_form(tag))
+            else:
+                occasion.on(lambda d: d.name == "start", make_form(tag))
+        nexus.add(occasion)
+        nexus.use(middleware)
+
+        nexus.emit(Datum(name="start", payload={}))
+
+        assert calls == [
+            "middleware:start",
+            "form:a",
+            "middleware:a",
+            "form:b",
+            "middleware:b",
+        ]
+
+    def test_emit_simple_case(self, nexus):
         """Test emit with a simple case (no derived data)."""
-        nexus = Nexus(name="test")
         occasion = ActualOccasion(name="occ", state={})
 
         # Selector that never matches
@@ -340,20 +642,14 @@ class TestNexus:
         assert len(result) == 1
         assert result[0] is datum
 
-    def test_emit_with_derived_data(self):
+    def test_emit_with_derived_data(self, nexus):
         """Test emit with occasions that generate derived data."""
-        nexus = Nexus(name="test")
         occasion = ActualOccasion(name="occ", state={})
 
         def create_derived(occ: ActualOccasion, d: Datum) -> list[Datum]:
-            if d.name == "input":
-                return [Datum(name="derived", payload={"source": d.name})]
-            return []
-
-        def selector(d: Datum) -> bool:
-            return d.name == "input"
+            return [Datum(name="derived", payload={"source": d.name})]
 
-        occasion.on(selector, create_derived)
+        occasion.on_name("input", create_derived)
         nexus.add(occasion)
 
         input_datum = Datum(name="input", payload={"data": "test"})
@@ -365,15 +661,39 @@ class TestNexus:
         assert result[1].correlation_id == input_datum.id
         assert result[1].causation_id == input_datum.id
 
-    def test_emit_with_chain_reaction(self):
+    def test_emit_threads_ids_without_rebuilding(self, nexus):
+        """Test emit keeps derived data that already carry the right ids."""
+        occasion = ActualOccasion(name="occ", state={})
+        input_datum = Datum(name="input", payload={})
+        stamped = Datum(
+            name="stamped",
+            payload={},
+            correlation_id=input_datum.id,
+            causation_id=input_datum.id,
+        )
+        unstamped = Datum(name="unstamped", payload={})
+
+        def form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            return [stamped, unstamped] if d.name == "input" else []
+
+        occasion.on(lambda d: True, form)
+        nexus.add(occasion)
+
+        result = nexus.emit(input_datum)
+
+        assert result[1] is stamped
+        assert result[2] is not unstamped
+        assert result[2].id == unstamped.id
+        assert result[2].created_at == unstamped.created_at
+        assert result[2].causation_id == input_datum.id
+
+    def test_emit_with_chain_reaction(self, nexus):
         """Test emit with a chain reaction of derived data."""
-        nexus = Nexus(name="test")
 
         # First occasion: input -> intermediate
         occ1 = ActualOccasion(name="occ1", state={})
 
-        def input_selector(d: Datum) -> bool:
-            return d.name == "input"
+        input_selector = name_selector("input")
 
         def input_form(occ: ActualOccasion, d: Datum) -> list[Datum]:
             return [Datum(name="intermediate", payload={"step": 1})]
@@ -383,8 +703,7 @@ class TestNexus:
         # Second occasion: intermediate -> final
         occ2 = ActualOccasion(name="occ2", state={})
 
-        def intermediate_selector(d: Datum) -> bool:
-            return d.name == "intermediate"
+        intermediate_selector = name_selector("intermediate")
 
         def intermediate_form(occ: ActualOccasion, d: Datum) -> list[Datum]:
             return [Datum(name="final", payload={"step": 2})]
@@ -407,32 +726,325 @@ class TestNexus:
         assert result[2].correlation_id == input_datum.id  # Same correlation
         assert result[2].causation_id == result[1].id  # Caused by intermediate
 
-    def test_emit_with_middleware(self):
-        """Test emit with middleware applied."""
-        nexus = Nexus(name="test")
+    def test_emit_is_breadth_first(self, nexus, occasion):
+        """Test emit processes derived data level by level, in FIFO order."""
 
-        # Middleware that adds a timestamp
-        def timestamp_middleware(datum: Datum) -> Datum:
-            return Datum(
-                name=datum.name,
-                payload={**datum.payload, "timestamp": "2001-01-01"},
-                id=datum.id,
-                created_at=datum.created_at,
-                correlation_id=datum.correlation_id,
-                causation_id=datum.causation_id,
-            )
+        def split(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            if len(d.name) == 3:
+                return []
+            return [
+                Datum(name=d.name + "a", payload={}),
+                Datum(name=d.name + "b", payload={}),
+            ]
 
-        nexus.use(timestamp_middleware)
+        nexus.add(occasion.on(lambda d: True, split))
 
-        datum = Datum(name="test", payload={"data": "value"})
-        result = nexus.emit(datum)
+        result = nexus.emit(Datum(name="a", payload={}), Datum(name="b", payload={}))
 
-        assert len(result) == 1
-        assert result[0].payload["timestamp"] == "2001-01-01"
+        names = [d.name for d in result]
+        assert names[:2] == ["a", "b"]
+        assert names[2:6] == ["aa", "ab", "ba", "bb"]
+        assert names[6:] == ["aaa", "aab", "aba", "abb", "baa", "bab", "bba", "bbb"]
+
+    def test_emit_with_name_bindings(self, nexus):
+        """Test emit dispatches name-keyed forms before selector-based ones."""
+        occasion = ActualOccasion(name="occ", state={"calls": []})
+
+        def keyed_form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            occ.state["calls"].append(("keyed", d.name))
+            return [Datum(name="derived", payload={})]
+
+        def generic_form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            occ.state["calls"].append(("generic", d.name))
+            return []
+
+        occasion.on(lambda d: True, generic_form)
+        nexus.add(occasion).bind_on("input", occasion, keyed_form)
+
+        input_datum = Datum(name="input", payload={})
+        result = nexus.emit(input_datum)
+
+        assert [d.name for d in result] == ["input", "derived"]
+        assert result[1].correlation_id == input_datum.id
+        assert result[1].causation_id == input_datum.id
+        assert occasion.state["calls"] == [
+            ("keyed", "input"),
+            ("generic", "input"),
+            ("generic", "derived"),
+        ]
+
+    def test_emit_skips_already_queued_ids(self, nexus):
+        """Test emit processes each datum id at most once."""
+        occasion = ActualOccasion(name="occ", state={"felt": 0})
+        echo = Datum(name="echo", payload={})
+
+        def form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            occ.state["felt"] += 1
+            # Re-emitting the same datum would otherwise loop forever
+            return [echo, echo]
+
+        occasion.on(lambda d: True, form)
+        nexus.add(occasion)
+
+        input_datum = Datum(name="input", payload={})
+        result = nexus.emit(input_datum, input_datum)
+
+        assert [d.name for d in result] == ["input", "echo"]
+        assert occasion.state["felt"] == 2
+
+    def test_emit_drops_replaced_copies_but_keeps_derived_data(self, nexus):
+        """Test a form's replace() copy is deduplicated while derive() is queued."""
+        occasion = ActualOccasion(name="occ", state={})
+
+        def replace_form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            return [d.replace(name="replaced")]
+
+        def derive_form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            return [d.derive(name="derived")]
+
+        nexus.add(occasion.on_name("raw", replace_form).on_name("raw", derive_form))
+
+        result = nexus.emit(Datum(name="raw", payload={}))
+
+        assert [d.name for d in result] == ["raw", "derived"]
+
+    def test_emit_calls_shared_selectors_once(self, nexus):
+        """Test a selector shared across bindings runs once per datum."""
+        occ1 = ActualOccasion(name="occ1", state={})
+        occ2 = ActualOccasion(name="occ2", state={})
+        calls: list[str] = []
+
+        def selector(d: Datum) -> bool:
+            calls.append(d.name)
+            return d.name == "input"
+
+        def form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            return [Datum(name=f"from_{occ.name}", payload={})]
+
+        occ1.on(selector, form)
+        occ2.on(lambda d: False, form).on(selector, form)
+        nexus.add(occ1, occ2)
+
+        result = nexus.emit(Datum(name="input", payload={}))
+
+        assert [d.name for d in result] == ["input", "from_occ1", "from_occ2"]
+        assert calls == ["input", "from_occ1", "from_occ2"]
+
+    def test_emit_ignores_occasions_added_mid_run(self, nexus):
+        """Test occasions and bindings added by a form apply from the next emit."""
+        late = ActualOccasion(name="late", state={"felt": 0})
+        occasion = ActualOccasion(name="occ", state={"felt": 0})
+
+        def count(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            occ.state["felt"] += 1
+            return []
+
+        def grow(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            if d.name != "input":
+                return []
+            late.on(lambda d: True, count)
+            nexus.add(late)
+            occ.on(lambda d: True, count)
+            return [Datum(name="derived", payload={})]
+
+        occasion.on(lambda d: True, grow)
+        nexus.add(occasion)
+
+        nexus.emit(Datum(name="input", payload={}))
+
+        assert nexus.snapshot() == {"occ": {"felt": 0}, "late": {"felt": 0}}
+
+        nexus.emit(Datum(name="other", payload={}))
+
+        assert nexus.snapshot() == {"occ": {"felt": 1}, "late": {"felt": 1}}
+
+    def test_emit_parallel_runs_occasions_concurrently(self, nexus):
+        """Test parallel emit runs forms of different occasions at once."""
+        # Each form waits for the other, which only works if both run at once
+        barrier = threading.Barrier(2, timeout=5)
+
+        def form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            if d.name != "input":
+                return []
+            barrier.wait()
+            return [Datum(name=f"from_{occ.name}", payload={})]
+
+        for name in ("occ1", "occ2"):
+            nexus.add(ActualOccasion(name=name, state={}).on(lambda d: True, form))
+
+        input_datum = Datum(name="input", payload={})
+        result = nexus.emit(input_datum, parallel=True)
+
+        assert [d.name for d in result] == ["input", "from_occ1", "from_occ2"]
+        assert all(d.causation_id == input_datum.id for d in result[1:])
+
+    def test_emit_parallel_preserves_sequential_order(self):
+        """Test parallel emit queues derived data in sequential order."""
+
+        def build() -> Nexus:
+            nexus = Nexus(name="test")
+            occ1 = ActualOccasion(name="occ1", state={})
+            occ2 = ActualOccasion(name="occ2", state={})
+
+            def form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+                if d.name != "input":
+                    return []
+                return [Datum(name=f"{occ.name}_{len(occ.state)}", payload={})]
+
+            def count(occ: ActualOccasion, d: Datum) -> list[Datum]:
+                occ.state[d.name] = True
+                return form(occ, d)
+
+            # Derived data only reach occ1, so they are not fanned out
+            occ1.on(lambda d: True, count)
+            occ2.on(name_selector("input"), form)
+            nexus.add(occ1, occ2).bind_on("input", occ1, form)
+            return nexus
+
+        sequential = build().emit(Datum(name="input", payload={}))
+        parallel = build().emit(Datum(name="input", payload={}), parallel=True)
+
+        assert [d.name for d in parallel] == [d.name for d in sequential]
+        assert [d.name for d in parallel] == ["input", "occ1_0", "occ1_1", "occ2_0"]
+
+    def test_emit_batch_groups_each_level_by_name(self, nexus):
+        """Test emit_batch processes a level grouped by datum name."""
+        occasion = ActualOccasion(name="occ", state={"felt": []})
+
+        def keyed_form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            return [Datum(name="derived", payload={"from": d.payload["i"]})]
+
+        def record(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            occ.state["felt"].append((d.name, d.payload.get("i")))
+            return []
+
+        occasion.on(lambda d: True, record)
+        nexus.add(occasion).bind_on("a", occasion, keyed_form)
+
+        data = [
+            Datum(name="a", payload={"i": 1}),
+            Datum(name="b", payload={"i": 2}),
+            Datum(name="a", payload={"i": 3}),
+        ]
+        result = nexus.emit_batch(data)
+
+        assert occasion.state["felt"] == [
+            ("a", 1),
+            ("a", 3),
+            ("b", 2),
+            ("derived", None),
+            ("derived", None),
+        ]
+        assert result[:3] == data
+        assert [d.payload["from"] for d in result[3:]] == [1, 3]
+        assert [d.causation_id for d in result[3:]] == [data[0].id, data[2].id]
+
+    def test_emit_batch_matches_emit_closure(self, nexus):
+        """Test emit_batch threads ids and dedupes like emit."""
+        occasion = ActualOccasion(name="occ", state={})
+
+        def form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            if d.name == "input":
+                return [Datum(name="intermediate", payload={})]
+            if d.name == "intermediate":
+                return [Datum(name="final", payload={})]
+            return []
+
+        occasion.on(lambda d: True, form)
+        nexus.add(occasion).use(lambda d: d)
+
+        input_datum = Datum(name="input", payload={})
+        result = nexus.emit_batch([input_datum, input_datum])
+
+        assert [d.name for d in result] == ["input", "intermediate", "final"]
+        assert result[2].correlation_id == input_datum.id
+        assert result[2].causation_id == result[1].id
+
+    def test_emit_batch_with_only_name_bindings(self, nexus, occasion):
+        """Test emit_batch runs keyed-only groups directly, threading ids."""
+
+        def form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            return [Datum(name="derived", payload={"from": d.payload["i"]})]
+
+        nexus.add(occasion.on_name("a", form))
+
+        data = [
+            Datum(name="a", payload={"i": 1}),
+            Datum(name="unbound", payload={"i": 2}),
+            Datum(name="a", payload={"i": 3}),
+        ]
+        result = nexus.emit_batch(data)
+
+        assert result[:3] == data
+        assert [d.payload["from"] for d in result[3:]] == [1, 3]
+        assert [d.causation_id for d in result[3:]] == [data[0].id, data[2].id]
+        assert [d.correlation_id for d in result[3:]] == [data[0].id, data[2].id]
+
+    def test_emit_levelsync_runs_bindings_over_whole_levels(self, nexus):
+        """Test emit_levelsync runs each binding across a level before the next."""
+        occ1 = ActualOccasion(name="occ1", state={"felt": []})
+        occ2 = ActualOccasion(name="occ2", state={"felt": []})
+
+        def form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            occ.state["felt"].append(d.name)
+            if d.name.startswith("in"):
+                return [Datum(name=f"{occ.name}_{d.name}", payload={})]
+            return []
+
+        def keyed_form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            return [Datum(name="keyed", payload={})]
+
+        occ1.on(lambda d: True, form)
+        occ2.on(lambda d: d.name.startswith("in"), form)
+        nexus.add(occ1, occ2).bind_on("in1", occ2, keyed_form)
+
+        inputs = [Datum(name="in1", payload={}), Datum(name="in2", payload={})]
+        result = nexus.emit_levelsync(*inputs)
+
+        assert [d.name for d in result] == [
+            "in1",
+            "in2",
+            "keyed",
+            "occ1_in1",
+            "occ1_in2",
+            "occ2_in1",
+            "occ2_in2",
+        ]
+        assert occ1.state["felt"][:2] == ["in1", "in2"]
+        assert occ2.state["felt"] == ["in1", "in2"]
+        assert result[4].causation_id == inputs[1].id
+        assert result[4].correlation_id == inputs[1].id
+
+        # Same data as a datum-major run, only in a different order
+        occ1.state["felt"].clear()
+        occ2.state["felt"].clear()
+        sequential = nexus.emit(*inputs)
+
+        assert sorted(d.name for d in sequential) == sorted(d.name for d in result)
+
+    def test_emit_applies_middleware_to_derived_data(self, nexus):
+        """Test emit runs middlewares on derived data after threading ids."""
+        occasion = ActualOccasion(name="occ", state={})
+
+        def form(occ: ActualOccasion, d: Datum) -> list[Datum]:
+            return [Datum(name="derived", payload={})] if d.name == "input" else []
+
+        def causation_middleware(datum: Datum) -> Datum:
+            payload = datum.payload.copy()
+            payload["caused_by"] = datum.causation_id
+            return datum.replace(payload=payload)
+
+        occasion.on(lambda d: True, form)
+        nexus.add(occasion).use(causation_middleware)
+
+        input_datum = Datum(name="input", payload={})
+        result = nexus.emit(input_datum)
+
+        assert [d.name for d in result] == ["input", "derived"]
+        assert result[1].payload["caused_by"] == input_datum.id
 
-    def test_snapshot(self):
+    def test_snapshot(self, nexus):
         """Test taking a snapshot of occasion states."""
-        nexus = Nexus(name="test")
 
         occ1 = ActualOccasion(name="counter", state={"count": 5})
         occ2 = ActualOccasion(name="accumulator", state={"total": 100, "items": 10})
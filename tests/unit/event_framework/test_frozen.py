@@ -0,0 +1,27 @@
+"""Unit tests for event_framework.frozen module."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from event_framework.frozen import fast_frozen_dataclass
+
+
+class TestFastFrozenDataclass:
+    """Tests for the fast_frozen_dataclass decorator."""
+
+    def test_returns_class_unchanged(self):
+        """Test the decorator has no runtime effect on the class."""
+
+        @dataclass(slots=True)
+        class Point:
+            """Value object."""
+
+            x: int
+
+        point_hash = Point.__hash__
+
+        assert fast_frozen_dataclass(Point) is Point
+        assert Point.__hash__ is point_hash
+        with pytest.raises(TypeError):
+            hash(Point(x=1))